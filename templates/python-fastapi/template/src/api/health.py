@@ -1,16 +1,27 @@
 """Health check endpoints."""
 
-from datetime import datetime
-
 from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic.config import ConfigDict
+from pydantic.main import BaseModel
+
+from src.api.responses import dumps, model_response
+from src.utils.clock import utc_now_iso
 
 router = APIRouter()
 
+# Serialized health body and the timestamp it was rendered for. Probes only
+# need second resolution, so the body is rebuilt at most once per second.
+_health_cache: tuple[str, bytes] = ("", b"")
+
+_LIVE_BODY = dumps({"status": "alive"})
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
     timestamp: str
     version: str
@@ -19,26 +30,31 @@ class HealthResponse(BaseModel):
 class ReadinessResponse(BaseModel):
     """Readiness check response model."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     ready: bool
     checks: dict[str, bool]
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint.
     
     Returns the current health status of the application.
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
-        version="0.1.0",
-    )
+    global _health_cache
+
+    timestamp = utc_now_iso()
+    cached_timestamp, body = _health_cache
+    if cached_timestamp != timestamp:
+        body = dumps({"status": "healthy", "timestamp": timestamp, "version": "0.1.0"})
+        _health_cache = (timestamp, body)
+    return Response(body, media_type="application/json")
 
 
 @router.get("/ready", response_model=ReadinessResponse)
-async def readiness_check() -> ReadinessResponse:
+async def readiness_check() -> Response:
     """
     Readiness check endpoint.
     
@@ -51,17 +67,18 @@ async def readiness_check() -> ReadinessResponse:
         # "cache": check_cache(),
     }
     
-    return ReadinessResponse(
+    response = ReadinessResponse(
         ready=all(checks.values()),
         checks=checks,
     )
+    return model_response(response)
 
 
-@router.get("/live")
-async def liveness_check() -> dict[str, str]:
+@router.get("/live", response_model=dict[str, str])
+async def liveness_check() -> Response:
     """
     Liveness check endpoint.
     
     Simple endpoint to verify the application is running.
     """
-    return {"status": "alive"}
+    return Response(_LIVE_BODY, media_type="application/json")
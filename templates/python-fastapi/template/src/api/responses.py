@@ -0,0 +1,40 @@
+"""Response classes shared by the API routers."""
+
+from functools import partial
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic.main import BaseModel
+
+# orjson encoder with the options every endpoint uses, bound once at import.
+dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes."""
+        return dumps(content)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Build a JSON response from a Pydantic model.
+
+    The model is serialized to JSON bytes by pydantic-core in a single pass,
+    without materializing an intermediate dict or str.
+
+    Args:
+        model: The model to serialize.
+        status_code: HTTP status code of the response.
+
+    Returns:
+        The JSON response.
+    """
+    return Response(
+        model.__pydantic_serializer__.to_json(model),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,46 +1,178 @@
 """API route definitions."""
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import email.message
+import os
+from typing import Annotated, Any, Optional
 
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.constants import REF_PREFIX
+from fastapi.openapi.utils import (
+    validation_error_definition,
+    validation_error_response_definition,
+)
+from fastapi.responses import Response
+from pydantic_core import ErrorDetails, ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from src.api.responses import ORJSONResponse, dumps, model_response
 from src.models.schemas import Item, ItemCreate, ItemList
 from src.services.example import ExampleService
 
 router = APIRouter()
-service = ExampleService()
+
+_ROOT_BODY = dumps({"message": "Welcome to {{project_name}} API"})
+
+
+def _sequential_ids_from_env() -> bool:
+    """
+    Read the item ID format from ITEM_ID_FORMAT.
+    
+    Returns:
+        True for "sequential" (the default), False for "uuid"; case-insensitive.
+    
+    Raises:
+        ValueError: If the variable holds any other value.
+    """
+    item_id_format = os.environ.get("ITEM_ID_FORMAT", "sequential").strip().lower()
+    if item_id_format not in ("sequential", "uuid"):
+        raise ValueError(
+            f"ITEM_ID_FORMAT must be 'sequential' or 'uuid', got {item_id_format!r}"
+        )
+    return item_id_format == "sequential"
+
+
+# Parsed at import so an invalid ID format fails at startup, not on first use.
+_SEQUENTIAL_IDS = _sequential_ids_from_env()
+_service: Optional[ExampleService] = None
+
+# Component schemas referenced by create_item's hand-written OpenAPI entries.
+# The route has no body parameter, so FastAPI does not register them itself;
+# main.py adds them to the generated document.
+_item_create_schema = ItemCreate.model_json_schema(ref_template=REF_PREFIX + "{model}")
+OPENAPI_SCHEMAS: dict[str, Any] = {
+    **_item_create_schema.pop("$defs", {}),
+    "ItemCreate": _item_create_schema,
+    "ValidationError": validation_error_definition,
+    "HTTPValidationError": validation_error_response_definition,
+}
+
+
+async def get_service() -> ExampleService:
+    """
+    Provide the shared service instance, created on first use.
+    
+    The provider is async so FastAPI resolves it on the event loop instead of
+    dispatching it to the threadpool on every request.
+    """
+    global _service
+
+    if _service is None:
+        _service = ExampleService(sequential_ids=_SEQUENTIAL_IDS)
+    return _service
+
+
+ServiceDep = Annotated[ExampleService, Depends(get_service)]
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Check a Content-Type header the way FastAPI does for JSON bodies."""
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    subtype = message.get_content_subtype()
+    return message.get_content_maintype() == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+def _body_error(error: ErrorDetails) -> dict[str, Any]:
+    """Prefix a validation error's location with "body" and drop raw byte inputs."""
+    body_error = {**error, "loc": ("body", *error["loc"])}
+    # Undecodable bytes would make FastAPI's error handler fail while encoding.
+    if isinstance(body_error.get("input"), bytes):
+        del body_error["input"]
+    return body_error
+
+
+# Handlers return a Response directly: FastAPI then skips its own
+# response_model validation and jsonable_encoder pass, while the declared
+# response_model still documents the endpoint in the OpenAPI schema.
+#
+# Item handlers are plain functions: ExampleService is synchronous and FastAPI
+# runs them in its threadpool, so they never block the event loop. create_item
+# must await the request body, so it hands the service call to the threadpool.
 
 
 @router.get("/", response_model=dict[str, str])
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {"message": "Welcome to {{project_name}} API"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @router.get("/items", response_model=ItemList)
-async def list_items() -> ItemList:
+def list_items(service: ServiceDep) -> ORJSONResponse:
     """List all items."""
-    items = await service.list_items()
-    return ItemList(items=items, total=len(items))
+    items = service.list_items()
+    return ORJSONResponse({"items": items, "total": len(items)})
 
 
 @router.get("/items/{item_id}", response_model=Item)
-async def get_item(item_id: str) -> Item:
+def get_item(item_id: str, service: ServiceDep) -> Response:
     """Get a specific item by ID."""
-    item = await service.get_item(item_id)
+    item = service.get_item(item_id)
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+    return model_response(item)
 
 
-@router.post("/items", response_model=Item, status_code=201)
-async def create_item(item: ItemCreate) -> Item:
+@router.post(
+    "/items",
+    response_model=Item,
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": {"$ref": REF_PREFIX + "ItemCreate"}}},
+            "required": True,
+        }
+    },
+    responses={
+        422: {
+            "description": "Validation Error",
+            "content": {
+                "application/json": {"schema": {"$ref": REF_PREFIX + "HTTPValidationError"}}
+            },
+        }
+    },
+)
+async def create_item(request: Request, service: ServiceDep) -> Response:
     """Create a new item."""
-    return await service.create_item(item)
+    # The raw body is validated by pydantic-core's JSON parser directly, without
+    # decoding it to a dict first; openapi_extra documents the request schema.
+    if not _is_json_content_type(request.headers.get("content-type")):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "content_type",
+                    "loc": ("body",),
+                    "msg": "Content-Type must be application/json",
+                }
+            ]
+        )
+    try:
+        item = ItemCreate.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [_body_error(error) for error in exc.errors(include_url=False)]
+        ) from exc
+    created = await run_in_threadpool(service.create_item, item)
+    return model_response(created, status_code=201)
 
 
 @router.delete("/items/{item_id}", status_code=204)
-async def delete_item(item_id: str) -> None:
+def delete_item(item_id: str, service: ServiceDep) -> None:
     """Delete an item."""
-    deleted = await service.delete_item(item_id)
+    deleted = service.delete_item(item_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Item not found")
@@ -3,15 +3,19 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.main import BaseModel
 
 
 class ItemBase(BaseModel):
     """Base model for items."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     name: str = Field(..., min_length=1, max_length=100, description="Item name")
     description: Optional[str] = Field(None, max_length=500, description="Item description")
-    tags: list[str] = Field(default_factory=list, description="Item tags")
+    tags: tuple[str, ...] = Field((), description="Item tags")
 
 
 class ItemCreate(ItemBase):
@@ -25,17 +29,14 @@ class Item(ItemBase):
 
     id: str = Field(..., description="Unique item identifier")
     created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
-
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    updated_at: Optional[datetime] = Field(..., description="Last update timestamp")
 
 
 class ItemList(BaseModel):
     """Model for item list responses."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     items: list[Item]
     total: int
 
@@ -43,5 +44,7 @@ class ItemList(BaseModel):
 class ErrorResponse(BaseModel):
     """Model for error responses."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     detail: str
     code: Optional[str] = None
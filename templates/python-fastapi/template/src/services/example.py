@@ -1,34 +1,99 @@
 """Example service implementation."""
 
+import itertools
+import threading
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 
 from src.models.schemas import Item, ItemCreate
+from src.utils.clock import utc_now
 
 logger = structlog.get_logger(__name__)
 
 
 class ExampleService:
-    """Example service for CRUD operations."""
+    """
+    Example service for CRUD operations.
+    
+    Methods are synchronous and may be called concurrently from FastAPI's
+    threadpool; a lock keeps the columns consistent across rows.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the service with in-memory storage."""
-        self._items: dict[str, Item] = {}
+    def __init__(self, sequential_ids: bool = True) -> None:
+        """
+        Initialize the service with in-memory columnar storage.
+        
+        Args:
+            sequential_ids: Generate short counter-based IDs ("i1", "i2", ...)
+                instead of random UUID4 strings.
+        """
+        self._sequential_ids = sequential_ids
+        self._next_id = itertools.count(1)
+        # One list per field; position i in every column describes the same item.
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._descriptions: list[Optional[str]] = []
+        self._tags: list[tuple[str, ...]] = []
+        self._created: list[datetime] = []
+        self._updated: list[Optional[datetime]] = []
+        # Item ID -> row position in the columns.
+        self._index: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Most recently fetched (item ID, item), so repeated reads of the same
+        # item skip the lookup. Items are frozen, so sharing them is safe.
+        self._last: Optional[tuple[str, Item]] = None
+
+    def _item_at(self, row: int) -> Item:
+        """Assemble the item stored at a row position."""
+        return Item.model_construct(
+            id=self._ids[row],
+            name=self._names[row],
+            description=self._descriptions[row],
+            tags=self._tags[row],
+            created_at=self._created[row],
+            updated_at=self._updated[row],
+        )
+
+    def _forget(self, item_id: str) -> None:
+        """Drop the recently fetched item if it is the given one."""
+        last = self._last
+        if last is not None and last[0] == item_id:
+            self._last = None
 
-    async def list_items(self) -> list[Item]:
+    def list_items(self) -> list[dict[str, Any]]:
         """
         List all items.
         
         Returns:
-            List of all items.
+            All items as JSON-serializable rows, in the field order of Item.
         """
-        logger.info("list_items", count=len(self._items))
-        return list(self._items.values())
+        with self._lock:
+            rows = [
+                {
+                    "name": name,
+                    "description": description,
+                    "tags": tags,
+                    "id": item_id,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                }
+                for item_id, name, description, tags, created_at, updated_at in zip(
+                    self._ids,
+                    self._names,
+                    self._descriptions,
+                    self._tags,
+                    self._created,
+                    self._updated,
+                    strict=True,
+                )
+            ]
+        logger.debug("list_items", count=len(rows))
+        return rows
 
-    async def get_item(self, item_id: str) -> Optional[Item]:
+    def get_item(self, item_id: str) -> Optional[Item]:
         """
         Get an item by ID.
         
@@ -38,10 +103,20 @@ class ExampleService:
         Returns:
             The item if found, None otherwise.
         """
-        logger.info("get_item", item_id=item_id)
-        return self._items.get(item_id)
+        logger.debug("get_item", item_id=item_id)
+        last = self._last
+        if last is not None and last[0] == item_id:
+            return last[1]
+        
+        with self._lock:
+            row = self._index.get(item_id)
+            if row is None:
+                return None
+            item = self._item_at(row)
+            self._last = (item_id, item)
+        return item
 
-    async def create_item(self, item_create: ItemCreate) -> Item:
+    def create_item(self, item_create: ItemCreate) -> Item:
         """
         Create a new item.
         
@@ -51,10 +126,25 @@ class ExampleService:
         Returns:
             The created item.
         """
-        item_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        if self._sequential_ids:
+            item_id = f"i{next(self._next_id)}"
+        else:
+            item_id = str(uuid.uuid4())
+        now = utc_now()
+        
+        with self._lock:
+            self._index[item_id] = len(self._ids)
+            self._ids.append(item_id)
+            self._names.append(item_create.name)
+            self._descriptions.append(item_create.description)
+            self._tags.append(item_create.tags)
+            self._created.append(now)
+            self._updated.append(None)
+        logger.info("create_item", item_id=item_id, name=item_create.name)
         
-        item = Item(
+        # Fields come from an already validated ItemCreate and server-generated
+        # values, so the model is assembled without re-running validation.
+        return Item.model_construct(
             id=item_id,
             name=item_create.name,
             description=item_create.description,
@@ -62,13 +152,8 @@ class ExampleService:
             created_at=now,
             updated_at=None,
         )
-        
-        self._items[item_id] = item
-        logger.info("create_item", item_id=item_id, name=item.name)
-        
-        return item
 
-    async def update_item(self, item_id: str, item_update: ItemCreate) -> Optional[Item]:
+    def update_item(self, item_id: str, item_update: ItemCreate) -> Optional[Item]:
         """
         Update an existing item.
         
@@ -79,36 +164,50 @@ class ExampleService:
         Returns:
             The updated item if found, None otherwise.
         """
-        if item_id not in self._items:
-            return None
-        
-        existing = self._items[item_id]
-        updated = Item(
-            id=item_id,
-            name=item_update.name,
-            description=item_update.description,
-            tags=item_update.tags,
-            created_at=existing.created_at,
-            updated_at=datetime.utcnow(),
-        )
-        
-        self._items[item_id] = updated
+        with self._lock:
+            row = self._index.get(item_id)
+            if row is None:
+                return None
+            
+            self._names[row] = item_update.name
+            self._descriptions[row] = item_update.description
+            self._tags[row] = item_update.tags
+            self._updated[row] = utc_now()
+            updated = self._item_at(row)
+            self._forget(item_id)
         logger.info("update_item", item_id=item_id)
         
         return updated
 
-    async def delete_item(self, item_id: str) -> bool:
+    def delete_item(self, item_id: str) -> bool:
         """
         Delete an item.
         
+        Later rows shift up by one, so listing order stays insertion order.
+        
         Args:
             item_id: The item identifier.
             
         Returns:
             True if deleted, False if not found.
         """
-        if item_id in self._items:
-            del self._items[item_id]
-            logger.info("delete_item", item_id=item_id)
-            return True
-        return False
+        with self._lock:
+            row = self._index.pop(item_id, None)
+            if row is None:
+                return False
+            self._forget(item_id)
+            
+            columns: tuple[list[Any], ...] = (
+                self._ids,
+                self._names,
+                self._descriptions,
+                self._tags,
+                self._created,
+                self._updated,
+            )
+            for column in columns:
+                del column[row]
+            for shifted, later_id in enumerate(self._ids[row:], start=row):
+                self._index[later_id] = shifted
+        logger.info("delete_item", item_id=item_id)
+        return True
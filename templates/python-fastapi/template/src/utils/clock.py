@@ -0,0 +1,41 @@
+"""Second-resolution UTC clock."""
+
+from datetime import UTC, datetime
+from time import time
+
+# UTC second, naive UTC datetime and its ISO string for the most recent call.
+# Swapped as one tuple so concurrent readers never see a mixed state.
+_cached: tuple[int, datetime, str] = (-1, datetime.min, "")
+
+
+def _refresh() -> tuple[int, datetime, str]:
+    """Return the cached clock values, rebuilding them when the second changes."""
+    global _cached
+
+    cached = _cached
+    second = int(time())
+    if second != cached[0]:
+        moment = datetime.fromtimestamp(second, UTC).replace(tzinfo=None)
+        cached = (second, moment, moment.isoformat())
+        _cached = cached
+    return cached
+
+
+def utc_now() -> datetime:
+    """
+    Get the current UTC time truncated to the second.
+    
+    Returns:
+        A naive datetime in UTC.
+    """
+    return _refresh()[1]
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time truncated to the second, in ISO 8601 format.
+    
+    Returns:
+        The ISO 8601 timestamp, without timezone suffix.
+    """
+    return _refresh()[2]
@@ -1,18 +1,31 @@
 """Test configuration and fixtures."""
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
+from src.api.routes import get_service
 from src.main import app
+from src.services.example import ExampleService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> TestClient:
-    """Create a test client for synchronous tests."""
+    """Create a test client shared by all synchronous tests."""
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def fresh_service() -> Iterator[ExampleService]:
+    """Give each test an empty service so stored items do not leak between tests."""
+    service = ExampleService()
+    app.dependency_overrides[get_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_service, None)
+
+
 @pytest.fixture
 async def async_client() -> AsyncClient:
     """Create an async test client."""
@@ -0,0 +1,111 @@
+"""Unit tests for the example service."""
+
+import uuid
+
+import pytest
+
+from src.models.schemas import Item, ItemCreate
+from src.services.example import ExampleService
+
+
+@pytest.fixture
+def service() -> ExampleService:
+    """Create an empty service."""
+    return ExampleService()
+
+
+class TestExampleService:
+    """Tests for ExampleService."""
+
+    def test_create_item_matches_validated_item(self, service: ExampleService) -> None:
+        """Test that a constructed item equals its fully validated counterpart."""
+        item_create = ItemCreate(name="Test Item", description="A test item", tags=["test"])
+
+        item = service.create_item(item_create)
+
+        assert item == Item.model_validate(item.model_dump())
+        assert item.name == item_create.name
+        assert item.description == item_create.description
+        assert item.tags == item_create.tags
+        assert item.updated_at is None
+
+    def test_update_item_keeps_creation_timestamp(self, service: ExampleService) -> None:
+        """Test that updating an item preserves its id and creation timestamp."""
+        created = service.create_item(ItemCreate(name="Before"))
+
+        updated = service.update_item(created.id, ItemCreate(name="After", tags=["new"]))
+
+        assert updated is not None
+        assert updated == Item.model_validate(updated.model_dump())
+        assert updated.id == created.id
+        assert updated.name == "After"
+        assert updated.tags == ("new",)
+        assert updated.created_at == created.created_at
+        assert updated.updated_at is not None
+
+    def test_update_item_not_found(self, service: ExampleService) -> None:
+        """Test updating a non-existent item."""
+        assert service.update_item("nonexistent", ItemCreate(name="Missing")) is None
+
+    def test_get_and_delete_item(self, service: ExampleService) -> None:
+        """Test fetching and deleting a created item."""
+        created = service.create_item(ItemCreate(name="Test Item"))
+
+        assert service.get_item(created.id) == created
+        assert service.delete_item(created.id) is True
+        assert service.get_item(created.id) is None
+
+    def test_list_items_after_delete(self, service: ExampleService) -> None:
+        """Test listing rows stays consistent with lookups after a delete."""
+        first = service.create_item(ItemCreate(name="First"))
+        second = service.create_item(ItemCreate(name="Second", tags=["b"]))
+        third = service.create_item(ItemCreate(name="Third"))
+
+        service.delete_item(first.id)
+        rows = service.list_items()
+
+        assert [row["id"] for row in rows] == [second.id, third.id]
+        for row in rows:
+            assert Item.model_validate(row) == service.get_item(row["id"])
+
+    def test_get_item_reflects_updates_and_deletes(self, service: ExampleService) -> None:
+        """Test repeated reads do not return stale items after a write."""
+        created = service.create_item(ItemCreate(name="Before"))
+        fetched = service.get_item(created.id)
+
+        assert service.get_item(created.id) is fetched
+
+        service.update_item(created.id, ItemCreate(name="After"))
+        updated = service.get_item(created.id)
+        assert updated is not None
+        assert updated.name == "After"
+
+        service.delete_item(created.id)
+        assert service.get_item(created.id) is None
+
+    def test_sequential_ids(self, service: ExampleService) -> None:
+        """Test the default IDs are short and sequential."""
+        first = service.create_item(ItemCreate(name="First"))
+        second = service.create_item(ItemCreate(name="Second"))
+
+        assert (first.id, second.id) == ("i1", "i2")
+
+    def test_uuid_ids(self) -> None:
+        """Test UUID IDs can still be requested."""
+        service = ExampleService(sequential_ids=False)
+
+        item = service.create_item(ItemCreate(name="Test Item"))
+
+        assert str(uuid.UUID(item.id)) == item.id
+
+    def test_delete_item_preserves_insertion_order(self, service: ExampleService) -> None:
+        """Test deleting from the middle keeps the remaining items in order."""
+        ids = [service.create_item(ItemCreate(name=f"Item {n}")).id for n in range(5)]
+
+        service.delete_item(ids[1])
+
+        assert [row["id"] for row in service.list_items()] == [ids[0], *ids[2:]]
+        for item_id in [ids[0], *ids[2:]]:
+            item = service.get_item(item_id)
+            assert item is not None
+            assert item.id == item_id
@@ -3,13 +3,9 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from src.main import app
-
-
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client."""
-    return TestClient(app)
+from src.api import routes
+from src.models.schemas import Item, ItemList
+from src.utils import clock
 
 
 class TestHealthEndpoints:
@@ -25,6 +21,19 @@ class TestHealthEndpoints:
         assert "timestamp" in data
         assert "version" in data
 
+    def test_health_check_timestamp_has_second_resolution(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the health body is reused within the same second."""
+        monkeypatch.setattr(clock, "time", lambda: 1_700_000_000.25)
+        first = client.get("/health")
+
+        monkeypatch.setattr(clock, "time", lambda: 1_700_000_000.75)
+        second = client.get("/health")
+
+        assert first.content == second.content
+        assert first.json()["timestamp"] == "2023-11-14T22:13:20"
+
     def test_readiness_check(self, client: TestClient) -> None:
         """Test the readiness check endpoint."""
         response = client.get("/ready")
@@ -82,6 +91,59 @@ class TestApiEndpoints:
         assert "id" in data
         assert "created_at" in data
 
+    def test_list_items_matches_schema(self, client: TestClient) -> None:
+        """Test the listing payload validates against ItemList."""
+        created = client.post("/api/v1/items", json={"name": "Listed", "tags": ["a"]}).json()
+
+        response = client.get("/api/v1/items")
+
+        assert response.status_code == 200
+        listing = ItemList.model_validate(response.json())
+        assert listing.total == len(listing.items)
+        assert Item.model_validate(created) in listing.items
+
+    def test_create_item_rejects_unknown_fields(self, client: TestClient) -> None:
+        """Test creating an item with an unknown field is rejected."""
+        response = client.post("/api/v1/items", json={"name": "Test Item", "color": "red"})
+        
+        assert response.status_code == 422
+
+    def test_create_item_invalid_json(self, client: TestClient) -> None:
+        """Test creating an item from a malformed body."""
+        response = client.post(
+            "/api/v1/items", content=b"{not json", headers={"Content-Type": "application/json"}
+        )
+        
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
+
+    def test_create_item_non_utf8_body(self, client: TestClient) -> None:
+        """Test creating an item from a body that is not valid UTF-8."""
+        response = client.post(
+            "/api/v1/items", content=b"\xff\xfe", headers={"Content-Type": "application/json"}
+        )
+        
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_create_item_requires_json_content_type(self, client: TestClient) -> None:
+        """Test creating an item with a non-JSON content type is rejected."""
+        response = client.post(
+            "/api/v1/items", content=b'{"name": "x"}', headers={"Content-Type": "text/plain"}
+        )
+        
+        assert response.status_code == 422
+
+    def test_create_item_documents_body_and_validation_error(self, client: TestClient) -> None:
+        """Test the create route documents its body and 422 response as components."""
+        schema = client.get("/openapi.json").json()
+        
+        operation = schema["paths"]["/api/v1/items"]["post"]
+        body_ref = operation["requestBody"]["content"]["application/json"]["schema"]["$ref"]
+        error_ref = operation["responses"]["422"]["content"]["application/json"]["schema"]["$ref"]
+        assert body_ref.rsplit("/", 1)[-1] in schema["components"]["schemas"]
+        assert error_ref.rsplit("/", 1)[-1] in schema["components"]["schemas"]
+
     def test_get_item_not_found(self, client: TestClient) -> None:
         """Test getting a non-existent item."""
         response = client.get("/api/v1/items/nonexistent")
@@ -93,3 +155,31 @@ class TestApiEndpoints:
         response = client.delete("/api/v1/items/nonexistent")
         
         assert response.status_code == 404
+
+
+class TestItemIdFormat:
+    """Tests for the ITEM_ID_FORMAT setting."""
+
+    @pytest.mark.parametrize(
+        ("value", "sequential"), [("sequential", True), ("uuid", False), (" UUID ", False)]
+    )
+    def test_valid_formats(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, sequential: bool
+    ) -> None:
+        """Test supported formats are accepted case-insensitively."""
+        monkeypatch.setenv("ITEM_ID_FORMAT", value)
+
+        assert routes._sequential_ids_from_env() is sequential
+
+    def test_default_format(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test IDs are sequential when the variable is unset."""
+        monkeypatch.delenv("ITEM_ID_FORMAT", raising=False)
+
+        assert routes._sequential_ids_from_env() is True
+
+    def test_invalid_format(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an unknown format is rejected instead of silently ignored."""
+        monkeypatch.setenv("ITEM_ID_FORMAT", "uuid4")
+
+        with pytest.raises(ValueError, match="ITEM_ID_FORMAT"):
+            routes._sequential_ids_from_env()